@@ -1,21 +1,44 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 from pathlib import Path
-from io import StringIO
+from io import StringIO, BytesIO
 import re
+import hashlib
+import orjson
 from dateutil import parser
 from datetime import datetime
 
+try:
+    from plotly_resampler import FigureResampler
+except ImportError:  # optional dependency; charts simply ship all points
+    FigureResampler = None
+
 # -------- CONFIG --------
 st.set_page_config(page_title="Programs Dashboard — Companies & Monthly Trends", layout="wide")
 BASE = Path(__file__).parent
 LOCAL_JSON = BASE / "data.json"
+CACHE_DIR = BASE / ".cache"
 
 # --------- Helpers & season mapping ---------
 DEFAULT_SEASON_MAP = {"spring": 4, "summer": 7, "autumn": 10, "fall": 10, "winter": 1}
 ALT_SEASON_MAP = {"spring": 4, "summer": 6, "autumn": 9, "fall": 9, "winter": 1}  # example alt (summer->June, autumn->Sep)
 
+# Pre-compiled patterns shared by the scalar and vectorized normalizers
+_SELF_RE = re.compile(r"self[- ]paced|immediate|on demand|online")
+_ROLL_RE = re.compile(r"rolling|varies|various|tbd|to be (?:decided|determined)")
+_SEASON_YEAR_RE = re.compile(r"(spring|summer|autumn|fall|winter)[^\d]*(\d{4})")
+_MONTH_YEAR_RE = re.compile(r"(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*[^\d]*(\d{4})")
+_YEAR_RE = re.compile(r"^(\d{4})$")
+_ANY_YEAR_RE = re.compile(r"(\d{4})")
+# datetime64[ns] can only hold 1677-2262; years outside go to "unknown"
+# instead of raising when assigned into the ns columns downstream
+_NS_YEAR_LO, _NS_YEAR_HI = 1677, 2262
+# one C-level alternation instead of per-row `any(season in s ...)` scans;
+# both season maps share the same keys so a single compiled pattern suffices
+_SEASON_WORD_RE = re.compile(r"\b(" + "|".join(DEFAULT_SEASON_MAP) + r")\b")
+
 def get_season_map(choice):
     return ALT_SEASON_MAP if choice == "Summer → June (alternate)" else DEFAULT_SEASON_MAP
 
@@ -31,77 +54,282 @@ def normalize_start_date(raw, season_map):
         return {"bucket_type": "unknown", "month_year": None, "label": "Unknown"}
 
     s = str(raw).strip().lower()
+    cur_year = datetime.now().year
 
     # Self-paced / immediate
-    if any(k in s for k in ["self-paced", "self paced", "immediate", "on demand", "online"]):
+    if _SELF_RE.search(s):
         return {"bucket_type": "self-paced", "month_year": None, "label": "Self-paced"}
-    if any(k in s for k in ["rolling", "varies", "various", "tbd", "to be decided", "to be determined"]):
+    if _ROLL_RE.search(s):
         return {"bucket_type": "rolling", "month_year": None, "label": "Rolling/Varies"}
 
     # exact season + year e.g., "summer 2026"
-    match = re.search(r"(spring|summer|autumn|fall|winter)[^\d]*(\d{4})", s)
+    match = _SEASON_YEAR_RE.search(s)
     if match:
         season = match.group(1)
         year = int(match.group(2))
-        m = season_map.get(season, 1)
-        ts = pd.Timestamp(year=year, month=m, day=1)
-        return {"bucket_type": "season", "month_year": ts, "label": ts.strftime("%b %Y")}
+        if _NS_YEAR_LO <= year <= _NS_YEAR_HI:
+            m = season_map.get(season, 1)
+            ts = pd.Timestamp(year=year, month=m, day=1)
+            return {"bucket_type": "season", "month_year": ts, "label": ts.strftime("%b %Y")}
 
     # season without year: use current year
     if s in season_map:
         m = season_map[s]
-        year = datetime.now().year
-        ts = pd.Timestamp(year=year, month=m, day=1)
+        ts = pd.Timestamp(year=cur_year, month=m, day=1)
         return {"bucket_type": "season", "month_year": ts, "label": ts.strftime("%b %Y")}
 
     # month + year like "June 2026"
-    match = re.search(r"(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*[^\d]*(\d{4})", s)
+    match = _MONTH_YEAR_RE.search(s)
     if match:
         month_str = match.group(1)
         year = int(match.group(2))
-        try:
-            dt = parser.parse(f"{month_str} {year}")
-            ts = pd.Timestamp(dt.year, dt.month, 1)
-            return {"bucket_type": "month-year", "month_year": ts, "label": ts.strftime("%b %Y")}
-        except Exception:
-            pass
+        if _NS_YEAR_LO <= year <= _NS_YEAR_HI:
+            try:
+                dt = parser.parse(f"{month_str} {year}")
+                ts = pd.Timestamp(dt.year, dt.month, 1)
+                return {"bucket_type": "month-year", "month_year": ts, "label": ts.strftime("%b %Y")}
+            except Exception:
+                pass
 
     # only year present -> choose mid-year
-    match = re.search(r"^(\d{4})$", s)
+    match = _YEAR_RE.search(s)
     if match:
         year = int(match.group(1))
-        ts = pd.Timestamp(year=year, month=7, day=1)
-        return {"bucket_type": "year-only", "month_year": ts, "label": ts.strftime("%b %Y")}
+        if _NS_YEAR_LO <= year <= _NS_YEAR_HI:
+            ts = pd.Timestamp(year=year, month=7, day=1)
+            return {"bucket_type": "year-only", "month_year": ts, "label": ts.strftime("%b %Y")}
 
     # season + 'rolling'
-    if "rolling" in s and any(season in s for season in season_map):
-        for season in season_map:
-            if season in s:
-                py = re.search(r"(\d{4})", s)
-                year = int(py.group(1)) if py else datetime.now().year
-                ts = pd.Timestamp(year=year, month=season_map[season], day=1)
+    if "rolling" in s:
+        m = _SEASON_WORD_RE.search(s)
+        if m:
+            py = _ANY_YEAR_RE.search(s)
+            year = int(py.group(1)) if py else cur_year
+            if _NS_YEAR_LO <= year <= _NS_YEAR_HI:
+                ts = pd.Timestamp(year=year, month=season_map[m.group(1)], day=1)
                 return {"bucket_type": "season", "month_year": ts, "label": ts.strftime("%b %Y")}
-        return {"bucket_type": "rolling", "month_year": None, "label": "Rolling/Varies"}
 
-    # try fuzzy parse
+    # last-resort fuzzy parse; partial dates like "March" default to the
+    # current year, and anything outside the Timestamp range stays unknown
     try:
-        dt = parser.parse(raw, fuzzy=True, default=datetime(datetime.now().year, 1, 1))
-        ts = pd.Timestamp(dt.year, dt.month, 1)
-        return {"bucket_type": "month-year", "month_year": ts, "label": ts.strftime("%b %Y")}
+        dt = parser.parse(s, fuzzy=True, default=datetime(cur_year, 1, 1))
+        year = cur_year if dt.year == 1 else dt.year
+        if _NS_YEAR_LO <= year <= _NS_YEAR_HI:
+            ts = pd.Timestamp(year, dt.month, 1)
+            return {"bucket_type": "month-year", "month_year": ts, "label": ts.strftime("%b %Y")}
     except Exception:
         pass
 
     return {"bucket_type": "unknown", "month_year": None, "label": raw}
 
+def normalize_start_dates(series, season_map):
+    """
+    Vectorized version of normalize_start_date over the whole start_date column.
+    Returns a DataFrame with 'bucket_type', 'month_year', 'label' columns.
+    Uses pandas string ops / extracts instead of a per-row .apply; only rows
+    that match none of the fast branches fall back to the per-row parser.
+    """
+    raw = series.astype("string")
+    s = raw.str.strip().str.lower()
+    cur_year = datetime.now().year
+
+    # branch masks (same precedence as the scalar function)
+    blank = s.isna() | (s == "")
+    m_self = s.str.contains(_SELF_RE, na=False)
+    m_roll = s.str.contains(_ROLL_RE, na=False)
+
+    season_year = s.str.extract(_SEASON_YEAR_RE)
+    month_year = s.str.extract(_MONTH_YEAR_RE)
+    year_only = s.str.extract(_YEAR_RE)[0]
+    season_bare = s.isin(list(season_map))
+
+    # years outside the ns range leave the fast branches (between() is False
+    # for NaN too) and fall through to the residual path, whose per-row
+    # parser routes them to "unknown" — mirroring the scalar guards
+    sy_in_range = pd.to_numeric(season_year[1], errors="coerce").between(_NS_YEAR_LO, _NS_YEAR_HI)
+    my_in_range = pd.to_numeric(month_year[1], errors="coerce").between(_NS_YEAR_LO, _NS_YEAR_HI)
+    yr_in_range = pd.to_numeric(year_only, errors="coerce").between(_NS_YEAR_LO, _NS_YEAR_HI)
+
+    # assemble month_year timestamps per branch (month-start)
+    ts = pd.Series(pd.NaT, index=series.index, dtype="datetime64[ns]")
+
+    m_sy = season_year[0].notna() & sy_in_range & ~blank & ~m_self & ~m_roll
+    if m_sy.any():
+        ts[m_sy] = pd.to_datetime(
+            {"year": season_year.loc[m_sy, 1].astype(int),
+             "month": season_year.loc[m_sy, 0].map(season_map).fillna(1).astype(int),
+             "day": 1}, errors="coerce")
+
+    m_bare = season_bare & ~m_sy & ~blank & ~m_self & ~m_roll
+    if m_bare.any():
+        ts[m_bare] = pd.to_datetime(
+            {"year": cur_year,
+             "month": s[m_bare].map(season_map).astype(int),
+             "day": 1}, errors="coerce")
+
+    m_my = month_year[0].notna() & my_in_range & ~m_sy & ~m_bare & ~blank & ~m_self & ~m_roll
+    if m_my.any():
+        ts[m_my] = pd.to_datetime(month_year.loc[m_my, 0] + " " + month_year.loc[m_my, 1],
+                                  format="%b %Y", errors="coerce")
+
+    m_yr = year_only.notna() & yr_in_range & ~m_sy & ~m_bare & ~m_my & ~blank & ~m_self & ~m_roll
+    if m_yr.any():
+        ts[m_yr] = pd.to_datetime(
+            {"year": year_only[m_yr].astype(int), "month": 7, "day": 1}, errors="coerce")
+
+    matched = blank | m_self | m_roll | m_sy | m_bare | m_my | m_yr
+
+    # residual rows: vectorized best-effort parse (NaT for failures), floored to month-start
+    residual = ~matched
+    m_fuzzy = pd.Series(False, index=series.index)
+    if residual.any():
+        # residual rows are the rare free-text stragglers, so the per-row
+        # fuzzy parser is cheap here and keeps one source of truth for the
+        # fallback semantics (current-year default, ns-range guard)
+        fb = pd.DataFrame(
+            [normalize_start_date(v, season_map) for v in s[residual]],
+            index=s[residual].index)
+        parsed = pd.to_datetime(fb["month_year"], errors="coerce")
+        m_fuzzy[residual] = parsed.notna()
+        ts[residual] = parsed
+
+    ts_label = ts.dt.strftime("%b %Y")
+
+    bucket_type = np.select(
+        [blank, m_self, m_roll, m_sy | m_bare, m_my | m_fuzzy, m_yr],
+        ["unknown", "self-paced", "rolling", "season", "month-year", "year-only"],
+        default="unknown")
+    label = np.select(
+        [blank, m_self, m_roll, m_sy | m_bare | m_my | m_yr | m_fuzzy],
+        ["Unknown", "Self-paced", "Rolling/Varies", ts_label.fillna("Unknown")],
+        default=raw.fillna("Unknown"))
+
+    return pd.DataFrame({"bucket_type": bucket_type, "month_year": ts, "label": label},
+                        index=series.index)
+
+RESAMPLE_THRESHOLD = 500  # points per trace before figures are downsampled
+
+def maybe_resample(fig, n_points):
+    """
+    Wrap big line/area figures in plotly-resampler's FigureResampler so only
+    the visible window's points are shipped to the browser. Small figures
+    (and installs without plotly-resampler) pass through unchanged.
+    """
+    if FigureResampler is not None and n_points > RESAMPLE_THRESHOLD:
+        return FigureResampler(fig)
+    return fig
+
+EXPECTED_COLS = ["domain", "program_name", "host_company_or_startup", "type",
+                 "application_deadline", "start_date", "location", "eligibility",
+                 "short_summary", "official_link", "source_name"]
+
+@st.cache_data
+def normalize_frame(df_raw: pd.DataFrame, season_choice: str) -> pd.DataFrame:
+    """
+    Heavy derivation pipeline: expected-column fill, company/domain/type cleanup,
+    vectorized start_date normalization and month-start computation.
+    Cached so unrelated widget tweaks don't re-run it on every rerun.
+    """
+    df = df_raw.copy()
+    for c in EXPECTED_COLS:
+        if c not in df.columns:
+            df[c] = pd.NA
+
+    # Low-cardinality strings are stored as category dtype: cheaper
+    # groupby/isin/pivot (hashing category codes instead of Python strings).
+    # The cleanup itself runs on string[pyarrow] rather than round-tripping
+    # through object dtype, so strip/fillna stay in Arrow's C string kernels.
+    df['company'] = (df['host_company_or_startup'].astype('string[pyarrow]')
+                     .str.strip().fillna('Unknown').astype('category'))
+    df['domain'] = df['domain'].astype('string[pyarrow]').fillna('Unknown').astype('category')
+    df['type'] = df['type'].astype('string[pyarrow]').fillna('Unknown').astype('category')
+
+    norms_df = normalize_start_dates(df['start_date'], get_season_map(season_choice))
+    month_dt = norms_df['month_year']  # may have NaT
+    # Single .assign block instead of pd.concat: no second frame copy, no
+    # fragmented-DataFrame warning. month_start is the month-start floor
+    # computed once; charts group by this plain column instead of rebuilding a
+    # pd.Grouper(freq='MS') resampling pass per chart.
+    df = df.assign(
+        bucket_type=norms_df['bucket_type'].astype('category'),
+        month_year=norms_df['month_year'],
+        label=norms_df['label'],
+        month_label=norms_df['label'].fillna("Unknown").astype('category'),
+        month_dt=month_dt,
+        month_start=month_dt.dt.to_period('M').dt.to_timestamp(),
+    )
+    return df
+
+@st.cache_data
+def aggregate(df_norm: pd.DataFrame, sel_domains: tuple, sel_types: tuple, year_range: tuple) -> dict:
+    """
+    Per-filter aggregation step, cached on the widget state (pass tuples, not
+    lists, so the arguments hash). Returns every frame the charts derive from.
+    """
+    mask = (df_norm['domain'].isin(sel_domains)) & (df_norm['type'].isin(sel_types))
+    filtered = df_norm[mask].copy()
+
+    # Year-range bounds and mask built once; the timeline-related blocks reuse
+    # in_range instead of reconstructing Timestamps per chart (NaT -> False).
+    _yr_lo = pd.Timestamp(year=year_range[0], month=1, day=1)
+    _yr_hi = pd.Timestamp(year=year_range[1], month=12, day=31)
+    in_range = filtered['month_dt'].between(_yr_lo, _yr_hi)
+
+    # One shared month x company aggregate; every monthly chart (timeline,
+    # heatmap, top-month table, drill-down, comparison) derives from this
+    # single groupby instead of re-scanning filtered per chart.
+    monthly_counts = (filtered.dropna(subset=['month_start'])
+                      .groupby(['month_start', 'company'], observed=True)
+                      .size().rename('count').reset_index())
+    mc_in_range = monthly_counts['month_start'].between(_yr_lo, _yr_hi)
+
+    by_company = (filtered.groupby('company', as_index=False, observed=True).size()
+                  .rename(columns={'size': 'program_count'}).sort_values('program_count', ascending=False))
+    domain_agg = (filtered.groupby('domain', as_index=False, observed=True).size()
+                  .rename(columns={'size': 'program_count'}).sort_values('program_count', ascending=False))
+    type_agg = (filtered.groupby('type', as_index=False, observed=True).size()
+                .rename(columns={'size': 'program_count'}).sort_values('program_count', ascending=False))
+
+    return {"filtered": filtered, "in_range": in_range,
+            "monthly_counts": monthly_counts, "mc_in_range": mc_in_range,
+            "by_company": by_company, "domain_agg": domain_agg, "type_agg": type_agg}
+
 # --------- Data load ---------
+# orjson decodes the records far faster than pd.read_json's parser; the frame
+# is then built directly from the decoded list of dicts.
 @st.cache_data
 def load_from_path(path: Path):
-    return pd.read_json(path)
+    return pd.DataFrame(orjson.loads(Path(path).read_bytes()))
 
 @st.cache_data
 def load_from_buffer(buffer: StringIO):
     buffer.seek(0)
-    return pd.read_json(buffer)
+    return pd.DataFrame(orjson.loads(buffer.read().encode("utf-8")))
+
+def get_normalized(path: Path, season_choice: str) -> pd.DataFrame:
+    """
+    Disk-cached load + normalize for the local JSON: keyed on the file's
+    mtime+size and the season choice, so editing data.json or switching the
+    mapping invalidates the cache. On a cache hit the normalized frame is read
+    straight from parquet, skipping JSON decode and normalization entirely.
+    The cache is best-effort — any read/write failure falls back to a fresh
+    normalize.
+    """
+    stat = path.stat()
+    key = hashlib.md5(f"{path}:{stat.st_mtime_ns}:{stat.st_size}:{season_choice}".encode()).hexdigest()
+    cache_file = CACHE_DIR / f"{key}.parquet"
+    if cache_file.exists():
+        try:
+            return pd.read_parquet(cache_file)
+        except Exception:
+            pass
+    df_norm = normalize_frame(load_from_path(path), season_choice)
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        df_norm.to_parquet(cache_file, compression="zstd")
+    except Exception:
+        pass  # e.g. pyarrow unavailable; caching is optional
+    return df_norm
 
 # --------- UI: controls ---------
 st.title("Programs Dashboard — Companies & Monthly Trends")
@@ -114,11 +342,10 @@ with col_top[1]:
 # Season mapping choice (user wanted ability to map Summer->June)
 st.sidebar.header("Display / parsing options")
 season_choice = st.sidebar.selectbox("Season → month mapping", ("Default (Summer→July)", "Summer → June (alternate)"))
-season_map = get_season_map(season_choice)
 
-# Top-N companies and comparison selection
+# Top-N companies for timeline / heatmap (comparison select is rendered after
+# the data loads, once the company options are known)
 top_n = st.sidebar.slider("Top N companies for timeline / heatmap", 1, 12, 6)
-compare_companies = st.sidebar.multiselect("Select companies to compare (multi-select)", options=[], default=[])
 
 # Year range slider placeholder (will be built after we know data years)
 st.sidebar.markdown("---")
@@ -128,11 +355,14 @@ st.sidebar.markdown("Tip: select companies above to drill down or compare them."
 try:
     if uploaded:
         df = load_from_buffer(StringIO(uploaded.getvalue().decode("utf-8")))
+        # Ensure expected columns + normalize (cached on data + season choice)
+        df = normalize_frame(df, season_choice)
     else:
         if not LOCAL_JSON.exists():
             st.error(f"Local file not found: {LOCAL_JSON}. Upload a JSON file or create one named data.json")
             st.stop()
-        df = load_from_path(LOCAL_JSON)
+        # local file path: parquet-cached on disk keyed by mtime+size+season
+        df = get_normalized(LOCAL_JSON, season_choice)
 except Exception as e:
     st.exception(e)
     st.stop()
@@ -141,29 +371,9 @@ if df.empty:
     st.warning("Dataset is empty.")
     st.stop()
 
-# Ensure expected columns
-expected_cols = ["domain", "program_name", "host_company_or_startup", "type",
-                 "application_deadline", "start_date", "location", "eligibility",
-                 "short_summary", "official_link", "source_name"]
-for c in expected_cols:
-    if c not in df.columns:
-        df[c] = pd.NA
-
-# Normalize columns and create convenience columns
-df['company'] = df['host_company_or_startup'].fillna("Unknown").astype(str).str.strip()
-df['domain'] = df['domain'].fillna("Unknown").astype(str)
-df['type'] = df['type'].fillna("Unknown").astype(str)
-df['program_count'] = 1
-
-# Normalize start_date using chosen season_map
-norms = df['start_date'].apply(lambda x: normalize_start_date(x, season_map))
-norms_df = pd.json_normalize(norms)
-df = pd.concat([df, norms_df], axis=1)
-df['month_label'] = df['label'].fillna("Unknown")
-df['month_dt'] = df['month_year']  # may have NaT
-
 # Year slider: build from available month_dt (if none, use current year)
-available_years = sorted(pd.Series([d.year for d in df['month_dt'].dropna().unique()]) if df['month_dt'].notna().any() else [datetime.now().year])
+yrs = df['month_dt'].dropna().dt.year.unique()
+available_years = sorted(yrs.tolist()) if len(yrs) else [datetime.now().year]
 if len(available_years) >= 2:
     year_min, year_max = available_years[0], available_years[-1]
 else:
@@ -172,44 +382,37 @@ else:
 
 year_range = st.sidebar.slider("Limit timeline to year range", int(year_min), int(year_max), (int(year_min), int(year_max)))
 
-# sidebar update for compare_companies after data loaded
-company_options = list(df['company'].value_counts().index)
-# replace compare_companies placeholder if empty
-if not compare_companies:
-    # choose top 3 by default
-    compare_companies = company_options[:3]
-# re-render multiselect with actual options
-compare_companies = st.sidebar.multiselect("Select companies to compare (multi-select)", options=company_options, default=compare_companies)
-
 # Domain & type filters
 domains = sorted(df['domain'].dropna().unique())
 sel_domains = st.sidebar.multiselect("Filter domain(s)", options=domains, default=domains)
 types = sorted(df['type'].dropna().unique())
 sel_types = st.sidebar.multiselect("Filter type(s)", options=types, default=types)
 
-# Apply filters
-mask = (df['domain'].isin(sel_domains)) & (df['type'].isin(sel_types))
-filtered = df[mask].copy()
-
-# year range mask for timeline-related visuals
-if filtered['month_dt'].notna().any():
-    start_year_dt = pd.Timestamp(year=year_range[0], month=1, day=1)
-    end_year_dt = pd.Timestamp(year=year_range[1], month=12, day=31)
-    year_mask = (filtered['month_dt'].notna()) & (filtered['month_dt'] >= start_year_dt) & (filtered['month_dt'] <= end_year_dt)
-else:
-    year_mask = pd.Series([False]*len(filtered), index=filtered.index)
+# Apply filters + aggregate (cached on the filter/widget state)
+aggs = aggregate(df, tuple(sel_domains), tuple(sel_types), tuple(year_range))
+filtered = aggs["filtered"]
+in_range = aggs["in_range"]
+year_mask = in_range
+monthly_counts = aggs["monthly_counts"]
+mc_in_range = aggs["mc_in_range"]
+by_company = aggs["by_company"]
+
+# comparison selection: by_company is already sorted by program count, so its
+# order doubles as the option ranking — no extra value_counts pass needed
+company_options = by_company['company'].astype(str).tolist()
+compare_companies = st.sidebar.multiselect("Select companies to compare (multi-select)",
+                                           options=company_options, default=company_options[:3])
 
 # ---------- KPIs ----------
 st.markdown("### Quick KPIs")
 k1, k2, k3, k4 = st.columns(4)
-k1.metric("Total programs", int(filtered['program_count'].sum()))
+k1.metric("Total programs", len(filtered))
 k2.metric("Unique host companies", int(filtered['company'].nunique()))
 k3.metric("Programs with month info", int(filtered['month_dt'].notna().sum()))
-k4.metric("Programs in selected year range", int(filtered[year_mask]['program_count'].sum()))
+k4.metric("Programs in selected year range", int(year_mask.sum()))
 
 # ---------- Top companies ----------
 st.markdown("### Top host companies (by number of programs)")
-by_company = filtered.groupby('company', as_index=False)['program_count'].sum().sort_values('program_count', ascending=False)
 st.dataframe(by_company.head(30).reset_index(drop=True))
 
 # top companies bar (clicking is not captured reliably in Streamlit; use selection control below to drill)
@@ -225,62 +428,50 @@ sel_company_multi = st.multiselect("Or pick companies to compare (multi-select)"
 # ---------- Monthly timeline (stacked) for Top N companies ----------
 st.markdown("### Monthly timeline (stacked) — Top N companies")
 top_companies = list(by_company.head(top_n)['company'])
-timeline_df = filtered[filtered['company'].isin(top_companies) & filtered['month_dt'].notna()].copy()
+agg = (monthly_counts[mc_in_range & monthly_counts['company'].isin(top_companies)]
+       .sort_values('month_start'))
 
-if timeline_df.empty:
+if agg.empty:
     st.info("No entries with parsable month/year for selected filters or top N.")
 else:
-    agg = (timeline_df.groupby([pd.Grouper(key='month_dt', freq='MS'), 'company'])
-           .size().reset_index(name='count').sort_values('month_dt'))
-    # limit to year range
-    agg = agg[(agg['month_dt'] >= pd.Timestamp(year=year_range[0], month=1, day=1)) & (agg['month_dt'] <= pd.Timestamp(year=year_range[1], month=12, day=31))]
-    fig_time = px.area(agg, x='month_dt', y='count', color='company', line_group='company',
+    fig_time = px.area(agg, x='month_start', y='count', color='company', line_group='company',
                        title=f"Monthly program counts (top {top_n} companies) — stacked")
     fig_time.update_xaxes(dtick="M1", tickformat="%b\n%Y")
     fig_time.update_layout(height=480)
-    st.plotly_chart(fig_time, use_container_width=True)
+    st.plotly_chart(maybe_resample(fig_time, len(agg)), use_container_width=True)
 
 # ---------- Heatmap: companies vs months ----------
 st.markdown("### Heatmap — Companies vs Months (counts)")
 # build pivot for heatmap using top_companies (or top_n)
 heat_companies = top_companies if top_companies else company_options[:top_n]
-heat_df = filtered[filtered['company'].isin(heat_companies) & filtered['month_dt'].notna()].copy()
-if heat_df.empty:
-    st.info("No month-parsable rows to build heatmap. Try adjusting filters or season mapping.")
+heat_agg = monthly_counts[mc_in_range & monthly_counts['company'].isin(heat_companies)]
+if heat_agg.empty:
+    st.info("No month-parsable rows to build heatmap. Try adjusting filters, year range or season mapping.")
 else:
-    heat_agg = (heat_df.groupby([pd.Grouper(key='month_dt', freq='MS'), 'company']).size().reset_index(name='count'))
-    # restrict by year_range
-    heat_agg = heat_agg[(heat_agg['month_dt'] >= pd.Timestamp(year=year_range[0], month=1, day=1)) & (heat_agg['month_dt'] <= pd.Timestamp(year=year_range[1], month=12, day=31))]
-    if heat_agg.empty:
-        st.info("No heatmap data after applying the selected year range.")
-    else:
-        pivot = heat_agg.pivot(index='company', columns='month_dt', values='count').fillna(0)
-        # sort companies by total desc
-        pivot['total'] = pivot.sum(axis=1)
-        pivot = pivot.sort_values('total', ascending=False).drop(columns='total')
-        # prepare labels
-        mx = pivot.columns
-        col_labels = [c.strftime("%b %Y") for c in mx]
-        fig_heat = px.imshow(pivot.values,
-                            x=col_labels,
-                            y=pivot.index,
-                            labels=dict(x="Month", y="Company", color="Programs"),
-                            aspect="auto",
-                            title=f"Programs heatmap — companies vs months (top {len(pivot.index)} companies)")
-        fig_heat.update_layout(height=500)
-        st.plotly_chart(fig_heat, use_container_width=True)
+    pivot = heat_agg.pivot_table(index='company', columns='month_start', values='count',
+                                 aggfunc='sum', fill_value=0, observed=True)
+    # sort companies by total desc (no scratch 'total' column needed)
+    pivot = pivot.loc[pivot.sum(axis=1).sort_values(ascending=False).index]
+    # prepare labels
+    mx = pivot.columns
+    col_labels = [c.strftime("%b %Y") for c in mx]
+    fig_heat = px.imshow(pivot.values,
+                        x=col_labels,
+                        y=pivot.index,
+                        labels=dict(x="Month", y="Company", color="Programs"),
+                        aspect="auto",
+                        title=f"Programs heatmap — companies vs months (top {len(pivot.index)} companies)")
+    fig_heat.update_layout(height=500)
+    st.plotly_chart(fig_heat, use_container_width=True)
 
 # ---------- Top-month per company ----------
 st.markdown("### Top month per company (month with highest program count)")
 # compute month for each company
-month_comp = filtered[filtered['month_dt'].notna()].copy()
-if month_comp.empty:
+if monthly_counts.empty:
     st.info("No parsable month entries to compute top-month per company.")
 else:
-    comp_month = (month_comp.groupby(['company', pd.Grouper(key='month_dt', freq='MS')])
-                  .size().reset_index(name='count'))
-    top_months = comp_month.loc[comp_month.groupby('company')['count'].idxmax()].sort_values('count', ascending=False)
-    top_months['month_label'] = top_months['month_dt'].dt.strftime("%b %Y")
+    top_months = monthly_counts.loc[monthly_counts.groupby('company', observed=True)['count'].idxmax()].sort_values('count', ascending=False)
+    top_months['month_label'] = top_months['month_start'].dt.strftime("%b %Y")
     st.dataframe(top_months[['company', 'month_label', 'count']].reset_index(drop=True).head(200))
 
 # ---------- Drill-down / Comparison graphs for selected companies ----------
@@ -290,13 +481,12 @@ st.markdown("### Drill-down / Comparison")
 if sel_company != "--All--":
     cd = filtered[filtered['company'] == sel_company].copy()
     st.markdown(f"#### Drill-down: {sel_company}")
-    st.write(f"Total programs: {int(cd['program_count'].sum())}")
+    st.write(f"Total programs: {len(cd)}")
     st.dataframe(cd[['program_name','domain','type','start_date','month_label','official_link']].reset_index(drop=True))
     # monthly trend for selected company
     if cd['month_dt'].notna().any():
-        cd_agg = cd.groupby(pd.Grouper(key='month_dt', freq='MS')).size().reset_index(name='count')
-        cd_agg = cd_agg[(cd_agg['month_dt'] >= pd.Timestamp(year=year_range[0], month=1, day=1)) & (cd_agg['month_dt'] <= pd.Timestamp(year=year_range[1], month=12, day=31))]
-        fig_cd = px.bar(cd_agg, x='month_dt', y='count', title=f"Monthly counts — {sel_company}")
+        cd_agg = monthly_counts[mc_in_range & (monthly_counts['company'] == sel_company)]
+        fig_cd = px.bar(cd_agg, x='month_start', y='count', title=f"Monthly counts — {sel_company}")
         fig_cd.update_xaxes(tickformat="%b\n%Y")
         st.plotly_chart(fig_cd, use_container_width=True)
     else:
@@ -304,36 +494,32 @@ if sel_company != "--All--":
 
 # Comparison for multi-selected companies
 if sel_company_multi:
-    comp_filter = filtered[filtered['company'].isin(sel_company_multi) & filtered['month_dt'].notna()].copy()
-    if comp_filter.empty:
+    comp_agg = monthly_counts[mc_in_range & monthly_counts['company'].isin(sel_company_multi)]
+    if comp_agg.empty:
         st.info("No data for the selected companies (or months missing).")
     else:
-        comp_agg = (comp_filter.groupby([pd.Grouper(key='month_dt', freq='MS'), 'company'])
-                    .size().reset_index(name='count'))
-        comp_agg = comp_agg[(comp_agg['month_dt'] >= pd.Timestamp(year=year_range[0], month=1, day=1)) & (comp_agg['month_dt'] <= pd.Timestamp(year=year_range[1], month=12, day=31))]
-        fig_cmp = px.line(comp_agg, x='month_dt', y='count', color='company', markers=True,
+        fig_cmp = px.line(comp_agg, x='month_start', y='count', color='company', markers=True,
                           title="Compare companies — monthly program counts")
         fig_cmp.update_xaxes(tickformat="%b\n%Y")
-        st.plotly_chart(fig_cmp, use_container_width=True)
+        st.plotly_chart(maybe_resample(fig_cmp, len(comp_agg)), use_container_width=True)
 
         # side-by-side small multiples: small bar charts per company
         st.markdown("#### Small multiples: monthly bars per selected company")
         cols = st.columns(min(len(sel_company_multi), 4))
         for i, comp in enumerate(sel_company_multi):
             with cols[i % len(cols)]:
-                one = comp_filter[comp_filter['company'] == comp]
-                agg_one = one.groupby(pd.Grouper(key='month_dt', freq='MS')).size().reset_index(name='count')
+                agg_one = comp_agg[comp_agg['company'] == comp]
                 if agg_one.empty:
                     st.write(f"{comp} — no month data")
                 else:
-                    fig_o = px.bar(agg_one, x='month_dt', y='count', title=comp)
+                    fig_o = px.bar(agg_one, x='month_start', y='count', title=comp)
                     fig_o.update_xaxes(tickformat="%b\n%Y")
-                    st.plotly_chart(fig_o, use_container_width=True)
+                    st.plotly_chart(maybe_resample(fig_o, len(agg_one)), use_container_width=True)
 
 # ---------- Domain breakdown & comparisons ----------
 st.markdown("### Domain & Type breakdowns")
-domain_agg = filtered.groupby('domain', as_index=False)['program_count'].sum().sort_values('program_count', ascending=False)
-type_agg = filtered.groupby('type', as_index=False)['program_count'].sum().sort_values('program_count', ascending=False)
+domain_agg = aggs["domain_agg"]
+type_agg = aggs["type_agg"]
 col1, col2 = st.columns(2)
 with col1:
     fig_dom = px.pie(domain_agg, names='domain', values='program_count', title="Programs by Domain")
@@ -348,8 +534,11 @@ st.markdown("### Raw / processed data (preview)")
 show_cols = ['program_name','company','domain','type','start_date','month_label','month_dt','official_link','source_name']
 st.dataframe(filtered[show_cols].sort_values(['month_dt','company'], ascending=[False, True]).reset_index(drop=True))
 
-csv = filtered.to_csv(index=False).encode('utf-8')
-st.download_button("Download processed CSV", data=csv, file_name="programs_processed.csv", mime="text/csv")
+# write straight into a bytes buffer: one copy instead of building the whole
+# CSV as a str and re-encoding it
+csv_buf = BytesIO()
+filtered.to_csv(csv_buf, index=False, encoding='utf-8')
+st.download_button("Download processed CSV", data=csv_buf.getvalue(), file_name="programs_processed.csv", mime="text/csv")
 
 # ---------- Footer notes ----------
 st.markdown("---")
@@ -20,9 +20,9 @@ def scrape_daily():
     # run scraper (you may modify run_scrape_interactive to return data instead of saving only)
     run_scrape_interactive()
 
-    # load the JSON file that scraper wrote
-    with open("scrap_data.json", "r", encoding="utf-8") as f:
-        data = json.load(f)
+    # load the JSONL file that scraper appends to
+    with open("scrap_data.jsonl", "r", encoding="utf-8") as f:
+        data = [json.loads(line) for line in f if line.strip()]
 
     return data[-15:]  # return last 15 records for context
 
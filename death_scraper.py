@@ -5,31 +5,71 @@ Robust daily death-case scraper (Google News RSS) with detailed terminal logs &
 - Attempts multiple queries and up to MAX_LINKS_PER_QUERY links each.
 - Verbose logging: prints RSS counts, per-link fetch status, reasons for skipping.
 - Stops when it has at least MIN_CASES_PER_RUN new records or when limits reached.
-- Saves results to scrap_data.json
+- Appends results to scrap_data.jsonl (one JSON record per line)
 
 Run:
   python death_scraper_verbose.py
 """
 
 import re
+import os
 import json
 import time
+import pickle
+import hashlib
 import argparse
+import asyncio
+import threading
+from io import BytesIO
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
-from urllib.parse import quote_plus, urlparse, unquote, parse_qs
+from email.utils import parsedate_to_datetime
+from types import MappingProxyType
+from urllib.parse import quote_plus, urlparse, urlunparse, unquote, parse_qs, parse_qsl
 
 import requests
-from bs4 import BeautifulSoup
-import feedparser
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import httpx
+from lxml import etree
 from dateutil import parser as dtparser
 
+try:
+    import ahocorasick
+except ImportError:  # optional; the compiled-regex gate is used instead
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is the fallback
+    orjson = None
+
 # -------------------------
 # Configurable parameters
 # -------------------------
-OUTPUT_FILE = "scrap_data.json"
+OUTPUT_JSONL = "scrap_data.jsonl"
+OUTPUT_FILE = "scrap_data.json"  # legacy array format, read-only for dedupe
+RSS_CACHE_FILE = "rss_cache.json"
 MIN_CASES_PER_RUN = 15
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120 Safari/537.36"
-HEADERS = {"User-Agent": USER_AGENT}
+HEADERS = {"User-Agent": USER_AGENT,
+           "Accept-Encoding": "gzip, deflate, br"}
+
+# Read at most this much of an article body; news pages routinely run to
+# megabytes of trackers/ads well past the paragraphs we keep.
+MAX_ARTICLE_BYTES = 512 * 1024
+
+# One pooled session for every HTTP call: keep-alive skips the TCP+TLS
+# handshake on repeat fetches from the same hosts, and transient 5xx/429
+# responses get a couple of backed-off retries.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64,
+                       max_retries=Retry(total=2, backoff_factor=0.3,
+                                         status_forcelist=[429, 500, 502, 503, 504]))
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
 
 # Queries used (fallback). We restrict to India using site:in and "when:1d" in RSS fetch.
 SEARCH_QUERIES = [
@@ -40,8 +80,8 @@ SEARCH_QUERIES = [
     '("drowned" OR "drowning") site:in',
 ]
 
-# mapping domain -> short source code for IDs
-DOMAIN_SOURCE_MAP = {
+# mapping domain -> short source code for IDs (read-only)
+DOMAIN_SOURCE_MAP = MappingProxyType({
     'timesofindia.indiatimes.com': 'TOI',
     'indianexpress.com': 'IE',
     'ndtv.com': 'NDTV',
@@ -49,30 +89,160 @@ DOMAIN_SOURCE_MAP = {
     'hindustantimes.com': 'HT',
     'telegraphindia.com': 'TELEGRAPH',
     'news18.com': 'NEWS18',
-}
+})
 
 # How many links to request per query (max)
 MAX_LINKS_PER_QUERY = 200
 
+# Precompiled extraction patterns (the per-article hot path); the age
+# patterns are tried in order — an "aged N" anywhere in the text wins
+# over an earlier "N-year-old" mention
+AGE_PATTERNS = (
+    re.compile(r'\baged?\s*(\d{1,3})\b', re.I),
+    re.compile(r'(\d{1,3})[-\s]?year[-\s]?old', re.I),
+    re.compile(r'(\d{1,3})\s*years?\s*old', re.I),
+)
+MALE_RE = re.compile(r'\b(man|male|him|he|boy)\b', re.I)
+FEMALE_RE = re.compile(r'\b(woman|female|she|her|girl)\b', re.I)
+# fallback keyword/category matcher: one alternation where the matching
+# named group *is* the cause category (underscores become spaces);
+# anchored on word boundaries like the baseline gate regex
+CAUSE_RE = re.compile(
+    r'\b(?:(?P<accident>accident|crash(?:es|ed)?)|(?P<suicide>suicide)|'
+    r'(?P<homicide>murder(?:ed)?|killed)|(?P<drowning>drown(?:ed|ing|s)?)|'
+    r'(?P<gunshot>gunshot|shot)|(?P<found_dead>found dead|body found)|'
+    r'(?P<death>death|dead|died|dies|victim))\b', re.I)
+
+# meta tag names that may carry the publish date, in priority order
+META_DATE_NAMES = ['article:published_time', 'pubdate', 'date', 'dc.date.issued', 'publishdate', 'timestamp']
+
+# keyword -> cause category, matched in one Aho-Corasick pass over the
+# lowercased text; hits are confirmed at word boundaries, so inflections
+# are listed explicitly
+GATE_KEYWORDS = {
+    "accident": "accident", "crash": "accident", "crashes": "accident", "crashed": "accident",
+    "suicide": "suicide",
+    "murder": "homicide", "murdered": "homicide", "killed": "homicide",
+    "drown": "drowning", "drowned": "drowning", "drowning": "drowning", "drowns": "drowning",
+    "shot": "gunshot", "gunshot": "gunshot",
+    "found dead": "found dead", "body found": "found dead",
+    "dead": "death", "death": "death", "died": "death", "dies": "death",
+    "victim": "death",
+}
+
+# the baseline acceptance filter: only these words let an article through
+# the gate. The rest of GATE_KEYWORDS ("crash", "drowning", "murdered", ...)
+# are classifier vocabulary — they refine the cause category but a story
+# mentioning only them (a market crash, an injuries-only pile-up) is not a
+# death report.
+GATE_WORDS = frozenset({
+    "dead", "death", "died", "dies", "killed", "murder", "suicide",
+    "accident", "body found", "found dead", "victim", "drowned", "shot",
+})
+GATE_RE = re.compile(
+    r'\b(?:dead|death|died|dies|killed|murder|suicide|accident|'
+    r'body found|found dead|victim|drowned|shot)\b', re.I)
+
+# compiled automaton persisted across runs; keyed by a hash of the keyword
+# list so edits to GATE_KEYWORDS invalidate it
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "death_scraper")
+AHO_CACHE = os.path.join(CACHE_DIR, "aho.pkl")
+
+def _build_automaton():
+    # the leading 3 versions the payload format ((len, cat, gates) tuples)
+    key = hashlib.md5(repr((3, sorted(GATE_KEYWORDS.items()))).encode()).hexdigest()
+    try:
+        with open(AHO_CACHE, "rb") as f:
+            cached_key, automaton = pickle.load(f)
+        if cached_key == key:
+            return automaton
+    except Exception:
+        pass
+    A = ahocorasick.Automaton()
+    for kw, cat in GATE_KEYWORDS.items():
+        A.add_word(kw, (len(kw), cat, kw in GATE_WORDS))
+    A.make_automaton()
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(AHO_CACHE, "wb") as f:
+            pickle.dump((key, A), f)
+    except Exception:
+        pass
+    return A
+
+AUTOMATON = _build_automaton() if ahocorasick is not None else None
+
+def keyword_hits(text_lower):
+    """(gate_ok, cause categories present in the text).
+
+    One linear Aho-Corasick scan replaces the chained regex/'in' checks of the
+    gate and classifier. Raw substring hits are confirmed at word boundaries
+    so "deadline" or "screenshot" don't pass the gate. Only GATE_WORDS hits
+    set gate_ok; classifier-only vocabulary still contributes a category.
+    Without pyahocorasick, one pass of the \\b-anchored named-group
+    alternation CAUSE_RE yields the categories via lastgroup and GATE_RE
+    supplies the gate decision."""
+    if AUTOMATON is not None:
+        gate_ok = False
+        hits = set()
+        last = len(text_lower) - 1
+        for end, (klen, cat, gates) in AUTOMATON.iter(text_lower):
+            start = end - klen + 1
+            if ((start == 0 or not text_lower[start - 1].isalnum())
+                    and (end == last or not text_lower[end + 1].isalnum())):
+                gate_ok = gate_ok or gates
+                hits.add(cat)
+        return gate_ok, hits
+    hits = {m.lastgroup.replace("_", " ") for m in CAUSE_RE.finditer(text_lower)}
+    return GATE_RE.search(text_lower) is not None, hits
+
 # Politeness / speed
 REQUEST_TIMEOUT = 10           # seconds per article fetch
-DELAY_BETWEEN_REQUESTS = 0.20  # seconds (reduced to speed up)
+DELAY_BETWEEN_REQUESTS = 0.20  # seconds between hits to the same host
+FETCH_WORKERS = 16             # article fetches in flight at once
 MAX_TOTAL_LINKS_TO_TRY = 1000  # safety cap across queries
 LOG_EVERY_N = 10               # progress log frequency while processing links
 
+# Per-host politeness: consecutive hits to the same host stay
+# DELAY_BETWEEN_REQUESTS apart, while fetches to different hosts run at
+# full speed. The fetch fan-out is single-threaded asyncio, so the
+# reservation needs no lock.
+_last_hit = {}
+
+async def _polite_wait(host):
+    now = time.monotonic()
+    wait = max(0.0, DELAY_BETWEEN_REQUESTS - (now - _last_hit.get(host, 0.0)))
+    _last_hit[host] = now + wait
+    if wait > 0:
+        await asyncio.sleep(wait)
+
 # -------------------------
 # Helpers
 # -------------------------
+@lru_cache(maxsize=4096)
+def _dateutil_date(s):
+    """Memoized dateutil fallback: date strings repeat across a feed/page,
+    and dateutil's rule cascade is slow enough to be worth a dict lookup."""
+    try:
+        return dtparser.parse(s).date().isoformat()
+    except Exception:
+        return None
+
 def parse_iso_date(dt):
     if not dt:
         return None
+    s = str(dt)
+    # fast paths: RSS dates are RFC-822, meta tags are usually ISO-8601;
+    # the slow dateutil parser only runs when both fail
     try:
-        if isinstance(dt, str):
-            return dtparser.parse(dt).date().isoformat()
-        # feedparser may present time tuple -> try generic parse
-        return dtparser.parse(str(dt)).date().isoformat()
-    except Exception:
-        return None
+        return parsedate_to_datetime(s).date().isoformat()
+    except (TypeError, ValueError):
+        pass
+    try:
+        return datetime.fromisoformat(s[:10]).date().isoformat()
+    except ValueError:
+        pass
+    return _dateutil_date(s)
 
 def resolve_google_link(link):
     """Resolve Google News wrapper links to original URL when possible."""
@@ -90,44 +260,151 @@ def resolve_google_link(link):
     # fallback: return as-is
     return link
 
-def google_news_rss_links(query, max_items=200):
-    """Fetch Google News RSS for a query and return resolved links (up to max_items)."""
+def _host_of(url):
+    """Lowercased host without www., by find/slice — urlparse is ~10x the
+    cost and this runs for every fetched article."""
+    i = url.find("://")
+    j = url.find("/", i + 3)
+    host = url[i + 3:j if j > 0 else None].lower()
+    return host[4:] if host.startswith("www.") else host
+
+def _canonical(url):
+    """Canonical form of a URL for dedupe: lowercased host without www.,
+    tracking query params (utm_*, fbclid, gclid) stripped."""
+    try:
+        parts = urlparse(url)
+        host = parts.netloc.lower()
+        if host.startswith("www."):
+            host = host[4:]
+        query = "&".join(f"{k}={v}" for k, v in parse_qsl(parts.query)
+                         if not k.startswith("utm_") and k not in ("fbclid", "gclid"))
+        return urlunparse((parts.scheme.lower(), host, parts.path, parts.params, query, ""))
+    except Exception:
+        return url
+
+# the RSS queries run concurrently, so file-level read-modify-write of the
+# cache must be serialized or the last writer discards the others' entries
+_rss_cache_lock = threading.Lock()
+
+def _load_rss_cache():
+    try:
+        with open(RSS_CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+def _save_rss_cache(cache):
+    try:
+        with open(RSS_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except Exception:
+        pass
+
+@lru_cache(maxsize=64)
+def google_news_rss_links(query, day_iso, max_items=200):
+    """Fetch Google News RSS for a query and return resolved links (up to max_items).
+
+    Cached in-process on (query, day_iso, max_items): the when:1d window barely
+    changes within a day, so repeat runs (e.g. the MCP server re-invoking the
+    scraper) skip the network round-trip entirely. Across processes, the
+    ETag/Last-Modified headers persisted in RSS_CACHE_FILE let the server
+    answer 304 Not Modified, skipping the body download and XML parse.
+    """
     q = quote_plus(query + " when:1d")
     rss_url = f"https://news.google.com/rss/search?q={q}&hl=en-IN&gl=IN&ceid=IN:en"
     print(f"\n[RSS] Fetching RSS for query: {query}")
     print(f"[RSS] URL: {rss_url}")
-    feed = feedparser.parse(rss_url)
-    n = len(feed.entries)
-    print(f"[RSS] feed returned {n} entries (will take up to {max_items})")
+    with _rss_cache_lock:
+        cached = _load_rss_cache().get(query) or {}
+    cond_headers = {}
+    if cached.get("etag"):
+        cond_headers["If-None-Match"] = cached["etag"]
+    if cached.get("modified"):
+        cond_headers["If-Modified-Since"] = cached["modified"]
+    resp = SESSION.get(rss_url, timeout=REQUEST_TIMEOUT, headers=cond_headers)
+    if resp.status_code == 304:
+        # a 304 body is empty, so never fall through to the XML parse;
+        # with no cached links there is simply nothing new for this query
+        links = cached.get("links") or []
+        print(f"[RSS] 304 Not Modified; reusing {len(links)} cached links")
+        return tuple(tuple(l) for l in links[:max_items])
+    # Google News RSS is well-formed XML with a fixed schema, so lxml with
+    # two findtext calls per item beats feedparser's per-entry sanitization
+    items = etree.fromstring(resp.content).xpath("//item")
+    print(f"[RSS] feed returned {len(items)} entries (will take up to {max_items})")
     links = []
-    for i, entry in enumerate(feed.entries[:max_items], start=1):
-        raw_link = entry.get("link")
-        resolved = resolve_google_link(raw_link)
+    for item in items[:max_items]:
+        resolved = resolve_google_link(item.findtext("link"))
         if resolved:
-            links.append((resolved, parse_iso_date(getattr(entry, "published", None) or getattr(entry, "published_parsed", None))))
+            links.append((resolved, parse_iso_date(item.findtext("pubDate"))))
     print(f"[RSS] resolved {len(links)} links from this query")
-    return links
-
-def fetch_article_text(url):
-    """Fetch article title, text, and meta publish date. Returns (title, text, publish_date_iso)."""
+    # re-read under the lock so entries written by the other query threads
+    # since our initial load aren't thrown away
+    with _rss_cache_lock:
+        cache = _load_rss_cache()
+        cache[query] = {"etag": resp.headers.get("ETag"),
+                        "modified": resp.headers.get("Last-Modified"),
+                        "links": links}
+        _save_rss_cache(cache)
+    return tuple(links)
+
+async def fetch_article_text(url, client):
+    """Fetch article title, text, and meta publish date over the shared
+    httpx client. Returns (title, text, publish_date_iso, status)."""
+    await _polite_wait(_host_of(url))
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
+        # stream so oversized pages can be cut off after MAX_ARTICLE_BYTES
+        # instead of downloaded whole
+        async with client.stream("GET", url) as resp:
+            if resp.status_code != 200:
+                return None, None, None, f"status-{resp.status_code}"
+            # headers arrive before the body: bail on PDFs/video pages and
+            # absurdly large documents without downloading them
+            ctype = resp.headers.get("Content-Type", "")
+            if ctype and not ctype.startswith(("text/html", "application/xhtml")):
+                return None, None, None, f"non-html:{ctype.split(';')[0]}"
+            try:
+                clen = int(resp.headers.get("Content-Length", "0"))
+            except ValueError:
+                clen = 0
+            if clen > 2_000_000:
+                return None, None, None, f"oversized:{clen}"
+            chunks, size = [], 0
+            async for chunk in resp.aiter_bytes():
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= MAX_ARTICLE_BYTES:
+                    break
+            body = b"".join(chunks)[:MAX_ARTICLE_BYTES]
     except Exception as e:
         return None, None, None, f"request-failed:{e}"
-    if resp.status_code != 200:
-        return None, None, None, f"status-{resp.status_code}"
     try:
-        soup = BeautifulSoup(resp.text, "html.parser")
-        title = (soup.title.string.strip() if soup.title and soup.title.string else "") or ""
-        # gather paragraph text
-        paragraphs = [p.get_text(" ", strip=True) for p in soup.find_all("p")]
-        paragraphs = [p for p in paragraphs if len(p) > 30]
-        text = " ".join(paragraphs[:8]) if paragraphs else ""
+        # tag-filtered iterparse: the parser only materializes title/p/meta
+        # elements and skips script/style/nav subtrees we never touch;
+        # clearing each element as we go keeps peak memory flat
+        title = ""
+        paragraphs = []
+        meta_dates = {}
+        for _, elem in etree.iterparse(BytesIO(body), events=("end",), html=True,
+                                       tag=("title", "p", "meta")):
+            if elem.tag == "p":
+                if len(paragraphs) < 8:
+                    txt = " ".join("".join(elem.itertext()).split())
+                    if len(txt) > 30:
+                        paragraphs.append(txt)
+            elif elem.tag == "title":
+                if not title:
+                    title = " ".join("".join(elem.itertext()).split())
+            else:
+                name = elem.get("property") or elem.get("name")
+                if name in META_DATE_NAMES and name not in meta_dates and elem.get("content"):
+                    meta_dates[name] = elem.get("content")
+            elem.clear()
+        text = " ".join(paragraphs)
         publish_date = None
-        for meta_name in ['article:published_time', 'pubdate', 'date', 'dc.date.issued', 'publishdate', 'timestamp']:
-            tag = soup.find("meta", attrs={"property": meta_name}) or soup.find("meta", attrs={"name": meta_name})
-            if tag and tag.get("content"):
-                publish_date = parse_iso_date(tag.get("content"))
+        for meta_name in META_DATE_NAMES:
+            if meta_name in meta_dates:
+                publish_date = parse_iso_date(meta_dates[meta_name])
                 if publish_date:
                     break
         return title, text, publish_date, "ok"
@@ -136,27 +413,33 @@ def fetch_article_text(url):
 
 def find_age_gender(text):
     age = None; gender = "Unknown"
-    m = re.search(r'\baged?\s*(\d{1,3})\b', text, flags=re.I) or re.search(r'(\d{1,3})[-\s]?year[-\s]?old', text, flags=re.I) or re.search(r'(\d{1,3})\s*years?\s*old', text, flags=re.I)
-    if m:
-        try:
-            age = int(m.group(1))
-        except Exception:
-            age = None
-    if re.search(r'\b(man|male|him|he|boy)\b', text, flags=re.I):
+    for pat in AGE_PATTERNS:
+        m = pat.search(text)
+        if m:
+            try:
+                age = int(m.group(1))
+            except Exception:
+                age = None
+            break
+    if MALE_RE.search(text):
         gender = "Male"
-    if re.search(r'\b(woman|female|she|her|girl)\b', text, flags=re.I):
+    if FEMALE_RE.search(text):
         gender = "Female"
     return age, gender
 
-def find_cause_and_context(text):
+def find_cause_and_context(text, hits=None):
     t = (text or "").lower()
-    if "accident" in t or "crash" in t: return "accident", text[:300]
-    if "suicide" in t: return "suicide", text[:300]
-    if "murder" in t or "killed" in t: return "homicide", text[:300]
-    if "drown" in t: return "drowning", text[:300]
-    if "train" in t and ("hit" in t or "collision" in t): return "train collision", text[:300]
-    if "shot" in t or "gunshot" in t: return "gunshot", text[:300]
-    if "found dead" in t or "body found" in t: return "found dead", text[:300]
+    if hits is None:
+        _, hits = keyword_hits(t)
+    for cause in ("accident", "suicide", "homicide", "drowning"):
+        if cause in hits:
+            return cause, text[:300]
+    # co-occurrence case a single keyword pass can't express
+    if "train" in t and ("hit" in t or "collision" in t):
+        return "train collision", text[:300]
+    for cause in ("gunshot", "found dead"):
+        if cause in hits:
+            return cause, text[:300]
     # fallback: pick first 200 chars
     return "death", (text or "")[:300] or None
 
@@ -166,12 +449,132 @@ def domain_to_source(domain):
 def normalize_case_id(source_code, date_iso, seq):
     return f"{source_code}-{date_iso}-{seq:03d}"
 
+def _loads(data):
+    """JSON decode via orjson when available (2-3x faster on loads)."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def _dumps_line(record):
+    """One JSONL line as UTF-8 bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
 def load_existing_output(path):
+    """Stream the source_urls already on disk into a set.
+
+    Dedupe only needs URL membership, so the record dicts are never
+    materialized; the legacy whole-file array (pre-JSONL scrap_data.json)
+    is still accepted."""
+    urls = set()
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(path, "rb") as f:
+            first = f.read(1)
+            f.seek(0)
+            if first == b"[":
+                records = _loads(f.read())
+            else:
+                records = []
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        try:
+                            records.append(_loads(line))
+                        except Exception:
+                            continue
+            for rec in records:
+                if isinstance(rec, dict) and rec.get("source_url"):
+                    urls.add(rec["source_url"])
     except Exception:
-        return []
+        pass
+    return urls
+
+
+async def _collect_cases(candidates, target_date, seen_urls, out_f):
+    """Fetch candidate articles concurrently and return the accepted records.
+
+    A semaphore caps in-flight fetches at FETCH_WORKERS; once
+    MIN_CASES_PER_RUN records are accepted the remaining tasks are
+    cancelled."""
+    collected = []
+    seq_counters = {}
+    limits = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+    sem = asyncio.Semaphore(FETCH_WORKERS)
+    async with httpx.AsyncClient(http2=True, headers=HEADERS, timeout=REQUEST_TIMEOUT,
+                                 limits=limits, follow_redirects=True) as client:
+
+        async def fetch_one(url, entry_date, canon):
+            async with sem:
+                result = await fetch_article_text(url, client)
+            return url, entry_date, canon, result
+
+        tasks = [asyncio.create_task(fetch_one(u, d, c)) for u, d, c in candidates]
+        try:
+            # process results as they land rather than in submission order, so
+            # one slow host doesn't hold up everything behind it
+            for i, fut in enumerate(asyncio.as_completed(tasks), start=1):
+                url, entry_date, canon, result = await fut
+                title, text, publish_date, fetch_status = result
+                if fetch_status != "ok":
+                    print(f"[FETCH] {i}/{len(tasks)} -> {fetch_status} for {url}")
+                    continue
+                if i % LOG_EVERY_N == 1:
+                    print(f"[INFO] Processing link {i}/{len(tasks)}: {url}")
+
+                # when user asked for specific date, ensure article publish_date matches target (best-effort)
+                if target_date and publish_date and publish_date != target_date:
+                    print(f"[SKIP] (article-date-mismatch) publish_date={publish_date} != target={target_date} | {url}")
+                    continue
+                # if no publish_date and user requested specific date, skip (to avoid wrong-day picks)
+                if target_date and not publish_date and entry_date is None:
+                    # skip ambiguous ones to be conservative
+                    if i % LOG_EVERY_N == 0:
+                        print(f"[SKIP] (no-date-info) skipping ambiguous article {url}")
+                    continue
+
+                combined = (title or "") + " " + (text or "")
+                # relaxed keyword filter (catch many variants), one linear pass
+                gate_ok, hits = keyword_hits(combined.lower())
+                if not gate_ok:
+                    if i % LOG_EVERY_N == 0:
+                        print(f"[SKIP] (no-keyword) {i}/{len(tasks)} - {title[:120]}")
+                    continue
+
+                # extract details
+                age, gender = find_age_gender(combined)
+                cause, context = find_cause_and_context(combined, hits)
+                host = _host_of(url)
+                src = domain_to_source(host)
+                seq_counters[src] = seq_counters.get(src, 0) + 1
+                case_id = normalize_case_id(src, target_date, seq_counters[src])
+
+                record = {
+                    "case_id": case_id,
+                    "reported_date": target_date,
+                    "state": None,
+                    "district": None,
+                    "gender": gender or "Unknown",
+                    "age": age if age is not None else None,
+                    "cause_of_death": cause,
+                    "reason_or_context": (context[:300] if context else None),
+                    "source_name": host,
+                    "source_url": url,
+                    "verified": True if host in DOMAIN_SOURCE_MAP else False
+                }
+
+                collected.append(record)
+                seen_urls.add(canon)
+                # append-only save: each accepted record lands on disk at once,
+                # so a crash mid-run loses nothing already collected
+                out_f.write(_dumps_line(record))
+                out_f.flush()
+                print(f"[ACCEPT] {len(collected)} | {case_id} | {host} | age={record['age']} | gender={record['gender']} | cause={record['cause_of_death']}")
+                if len(collected) >= MIN_CASES_PER_RUN:
+                    break  # target met: the finally block drops the rest
+        finally:
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    return collected
 
 # -------------------------
 # Main scraping routine
@@ -189,116 +592,74 @@ def run_scrape_interactive():
         target_date = datetime.now(timezone.utc).date().isoformat()
 
     print(f"[RUN] Target date: {target_date}")
-    existing = load_existing_output(OUTPUT_FILE)
-    seen_urls = {e.get("source_url") for e in existing if isinstance(e, dict) and e.get("source_url")}
-    print(f"[INFO] Already have {len(existing)} records in {OUTPUT_FILE}. Seen URLs={len(seen_urls)}")
+    run_day = datetime.now(timezone.utc).date().isoformat()  # RSS cache key
+    existing_urls = load_existing_output(OUTPUT_JSONL) | load_existing_output(OUTPUT_FILE)
+    seen_urls = {_canonical(u) for u in existing_urls}
+    print(f"[INFO] Seen URLs from previous runs: {len(seen_urls)}")
 
-    collected = []
-    seq_counters = {}
     total_links_tried = 0
 
-    # iterate queries (fallback list)
-    for q_idx, query in enumerate(SEARCH_QUERIES, start=1):
-        if len(collected) >= MIN_CASES_PER_RUN:
+    # Fetch all RSS feeds in parallel on the keep-alive session: the feeds
+    # are independent, so five sequential roundtrips collapse into one.
+    rss_results = {}
+    with ThreadPoolExecutor(max_workers=len(SEARCH_QUERIES)) as ex:
+        rss_futures = {ex.submit(google_news_rss_links, q, run_day, MAX_LINKS_PER_QUERY): q
+                       for q in SEARCH_QUERIES}
+        for fut in as_completed(rss_futures):
+            query = rss_futures[fut]
+            try:
+                rss_results[query] = fut.result()
+            except Exception as e:
+                print(f"[RSS ERROR] Query failed ({query}): {e}")
+                rss_results[query] = ()
+
+    # Merge in query order and dedupe on canonical URLs: the queries overlap
+    # heavily, and the same story often reappears with different tracking
+    # params, so keying on the canonical form drops those repeats too.
+    unique = {}
+    for query in SEARCH_QUERIES:
+        for url, entry_date in rss_results.get(query, ()):
+            if url:
+                unique.setdefault(_canonical(url), (url, entry_date))
+    links_with_dates = list(unique.items())
+    print(f"\n[STEP] {len(links_with_dates)} unique links across {len(SEARCH_QUERIES)} queries.")
+
+    # cheap skips first, so the fetch pool only sees real candidates
+    candidates = []
+    for i, (canon, (url, entry_date)) in enumerate(links_with_dates, start=1):
+        total_links_tried += 1
+        if total_links_tried > MAX_TOTAL_LINKS_TO_TRY:
+            print("[LIMIT] Reached overall max links tried cap. Stopping.")
             break
-        print(f"\n[STEP] Running query #{q_idx}/{len(SEARCH_QUERIES)}: {query}")
-        try:
-            links_with_dates = google_news_rss_links(query, max_items=MAX_LINKS_PER_QUERY)
-        except Exception as e:
-            print(f"[RSS ERROR] Query failed: {e}")
+
+        if canon in seen_urls:
+            if i % LOG_EVERY_N == 0:
+                print(f"[SKIP] (already seen) {i}/{len(links_with_dates)} - {url}")
             continue
 
-        print(f"[STEP] Processing up to {len(links_with_dates)} links from this query.")
-        for i, (url, entry_date) in enumerate(links_with_dates, start=1):
-            if len(collected) >= MIN_CASES_PER_RUN:
-                break
-            total_links_tried += 1
-            if total_links_tried > MAX_TOTAL_LINKS_TO_TRY:
-                print("[LIMIT] Reached overall max links tried cap. Stopping.")
-                break
-
-            if not url:
-                continue
-            if url in seen_urls:
-                if i % LOG_EVERY_N == 0:
-                    print(f"[SKIP] (already seen) {i}/{len(links_with_dates)} - {url}")
-                continue
-
-            # If the RSS entry reports a date and it doesn't match target, skip early
-            if entry_date and entry_date != target_date:
-                if i % LOG_EVERY_N == 0:
-                    print(f"[SKIP] (rss-date-mismatch) {i}/{len(links_with_dates)} - entry_date={entry_date}")
-                continue
-
-            if i % LOG_EVERY_N == 1:
-                print(f"[INFO] Processing link {i}/{len(links_with_dates)}: {url}")
-
-            title, text, publish_date, fetch_status = fetch_article_text(url)
-            if fetch_status != "ok":
-                print(f"[FETCH] {i}/{len(links_with_dates)} -> {fetch_status} for {url}")
-                time.sleep(DELAY_BETWEEN_REQUESTS)
-                continue
-
-            # when user asked for specific date, ensure article publish_date matches target (best-effort)
-            if target_date and publish_date and publish_date != target_date:
-                print(f"[SKIP] (article-date-mismatch) publish_date={publish_date} != target={target_date} | {url}")
-                time.sleep(DELAY_BETWEEN_REQUESTS)
-                continue
-            # if no publish_date and user requested specific date, skip (to avoid wrong-day picks)
-            if target_date and not publish_date and entry_date is None:
-                # skip ambiguous ones to be conservative
-                if i % LOG_EVERY_N == 0:
-                    print(f"[SKIP] (no-date-info) skipping ambiguous article {url}")
-                time.sleep(DELAY_BETWEEN_REQUESTS)
-                continue
-
-            combined = (title or "") + " " + (text or "")
-            # relaxed keyword filter (catch many variants)
-            if not re.search(r'\b(dead|death|died|dies|killed|murder|suicide|accident|body found|found dead|victim|drowned|shot)\b', combined, flags=re.I):
-                if i % LOG_EVERY_N == 0:
-                    print(f"[SKIP] (no-keyword) {i}/{len(links_with_dates)} - {title[:120]}")
-                time.sleep(DELAY_BETWEEN_REQUESTS)
-                continue
-
-            # extract details
-            age, gender = find_age_gender(combined)
-            cause, context = find_cause_and_context(combined)
-            host = urlparse(url).netloc.lower().replace("www.", "")
-            src = domain_to_source(host)
-            seq_counters[src] = seq_counters.get(src, 0) + 1
-            case_id = normalize_case_id(src, target_date, seq_counters[src])
-
-            record = {
-                "case_id": case_id,
-                "reported_date": target_date,
-                "state": None,
-                "district": None,
-                "gender": gender or "Unknown",
-                "age": age if age is not None else None,
-                "cause_of_death": cause,
-                "reason_or_context": (context[:300] if context else None),
-                "source_name": host,
-                "source_url": url,
-                "verified": True if host in DOMAIN_SOURCE_MAP else False
-            }
-
-            collected.append(record)
-            seen_urls.add(url)
-            print(f"[ACCEPT] {len(collected)} | {case_id} | {host} | age={record['age']} | gender={record['gender']} | cause={record['cause_of_death']}")
-            time.sleep(DELAY_BETWEEN_REQUESTS)
-
-        # safety: if reached global cap, break outer loop
-        if total_links_tried > MAX_TOTAL_LINKS_TO_TRY:
-            break
+        # If the RSS entry reports a date and it doesn't match target, skip early
+        if entry_date and entry_date != target_date:
+            if i % LOG_EVERY_N == 0:
+                print(f"[SKIP] (rss-date-mismatch) {i}/{len(links_with_dates)} - entry_date={entry_date}")
+            continue
+
+        candidates.append((url, entry_date, canon))
+
+    # Fetch fan-out: one httpx HTTP/2 client, so the many in-flight
+    # requests that land on the same few news hosts (TOI, HT, NDTV)
+    # multiplex a single connection instead of opening one each. All
+    # candidates are submitted (the list is already bounded by
+    # MAX_TOTAL_LINKS_TO_TRY); over-fetching is prevented by the early
+    # break plus task cancellation once the per-run target is met.
+    out_f = open(OUTPUT_JSONL, "ab")
+    try:
+        collected = asyncio.run(_collect_cases(candidates, target_date, seen_urls, out_f))
+    finally:
+        out_f.close()
 
-    # summary and save
+    # summary (records were already appended to the JSONL as they landed)
     if collected:
-        existing_by_url = {e.get("source_url"): e for e in existing if isinstance(e, dict)}
-        new_records = [r for r in collected if r["source_url"] not in existing_by_url]
-        final = existing + new_records
-        with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-            json.dump(final, f, indent=2, ensure_ascii=False)
-        print(f"\n[DONE] Collected {len(collected)} candidates in this run; appended {len(new_records)} new records to {OUTPUT_FILE}.")
+        print(f"\n[DONE] Appended {len(collected)} new records to {OUTPUT_JSONL}.")
     else:
         print("\n[DONE] No new records collected in this run. No changes written to file.")
 